@@ -0,0 +1,124 @@
+"""Benchmark comparing ingest and query latency across the vector store backends.
+
+Queries are timed both unfiltered and restricted to a single source file.
+
+Uses deterministic fake embeddings so that only the store itself is measured, not the embeddings API.
+
+Usage:
+    python -m benchmarks.benchmark_vector_stores --chunks 5000 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.backend.services.vector_service.faiss_store import FaissVectorStore
+from src.backend.services.vector_service.models.models import SearchFilter
+from src.backend.services.vector_service.vector_store import VectorStore
+
+SESSION_ID = "benchmark"
+WORDS = "contract clause payment term party notice liability annex page section renewal".split()
+
+
+def build_faiss(embeddings: DeterministicFakeEmbedding, workdir: str) -> VectorStore:
+    """Build a FAISS store persisted under the benchmark working directory."""
+    return FaissVectorStore(embeddings, workdir)
+
+
+def build_qdrant(embeddings: DeterministicFakeEmbedding, workdir: str) -> VectorStore:
+    """Build a Qdrant store running in embedded local mode under the benchmark working directory."""
+    from qdrant_client import QdrantClient
+
+    from src.backend.services.vector_service.qdrant_store import QdrantVectorStore
+
+    return QdrantVectorStore(
+        embeddings, QdrantClient(path=workdir), "benchmark", create_payload_indexes=False
+    )
+
+
+BACKENDS: Dict[str, Callable[[DeterministicFakeEmbedding, str], VectorStore]] = {
+    "faiss": build_faiss,
+    "qdrant": build_qdrant,
+}
+
+
+def synthetic_chunks(n: int, rng: random.Random) -> List[str]:
+    """Generate n pseudo-random chunk texts."""
+    return [" ".join(rng.choices(WORDS, k=60)) for _ in range(n)]
+
+
+def time_queries(store: VectorStore, queries: List[str], k: int, filters: Optional[SearchFilter]) -> List[float]:
+    """Run every query against the store and return the sorted latencies in ms."""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        store.similarity_search(SESSION_ID, query, k=k, filters=filters)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return sorted(latencies)
+
+
+def percentile(latencies: List[float], q: float) -> float:
+    """Return the q-th quantile of sorted latencies."""
+    return latencies[max(int(len(latencies) * q) - 1, 0)]
+
+
+def run_backend(name: str, chunks: List[str], queries: List[str], batch_size: int, k: int, dim: int) -> dict:
+    """Ingest the chunks in batches (one source file per batch), then time unfiltered and filtered queries."""
+    embeddings = DeterministicFakeEmbedding(size=dim)
+    with tempfile.TemporaryDirectory() as workdir:
+        store = BACKENDS[name](embeddings, workdir)
+
+        start = time.perf_counter()
+        for i in range(0, len(chunks), batch_size):
+            batch = chunks[i : i + batch_size]
+            source = f"file_{i // batch_size}.pdf"
+            metas = [{"source": source, "page": j + 1, "chunk_id": j} for j in range(len(batch))]
+            store.add_texts(SESSION_ID, batch, metas)
+        ingest_ms = (time.perf_counter() - start) * 1000
+
+        unfiltered = time_queries(store, queries, k, None)
+        filtered = time_queries(store, queries, k, SearchFilter(source="file_0.pdf"))
+
+    return {
+        "backend": name,
+        "ingest_ms": ingest_ms,
+        "query_p50_ms": statistics.median(unfiltered),
+        "query_p95_ms": percentile(unfiltered, 0.95),
+        "filtered_p50_ms": statistics.median(filtered),
+        "filtered_p95_ms": percentile(filtered, 0.95),
+    }
+
+
+def main() -> None:
+    """Parse arguments, run every selected backend, and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=sorted(BACKENDS))
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    chunks = synthetic_chunks(args.chunks, rng)
+    queries = [" ".join(rng.choices(WORDS, k=8)) for _ in range(args.queries)]
+
+    print(f"{'backend':<10}{'ingest ms':>12}{'p50 ms':>10}{'p95 ms':>10}{'filt p50':>10}{'filt p95':>10}")
+    for name in args.backends:
+        stats = run_backend(name, chunks, queries, args.batch_size, args.k, args.dim)
+        print(
+            f"{stats['backend']:<10}{stats['ingest_ms']:>12.1f}"
+            f"{stats['query_p50_ms']:>10.2f}{stats['query_p95_ms']:>10.2f}"
+            f"{stats['filtered_p50_ms']:>10.2f}{stats['filtered_p95_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 """API routes for chat interactions."""
 
 import logging
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from src.backend.api_routes.models.models import UserRequest, ChatResponse
 from src.backend.services.chat_service.chat_service import ChatService
+from src.backend.services.vector_service.vector_store import NoMatchingChunksError
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,7 @@ async def ask(request: UserRequest) -> ChatResponse:
     """Endpoint to handle user chat requests within a session.
 
     Inputs:
-    request: UserRequest object containing the session_id and user_input
+    request: UserRequest object containing the session_id, user_input, and optional retrieval filters
 
     Returns:
     ChatResponse: The structured response containing the session_id, user input, and the model-generated response
@@ -25,7 +26,9 @@ async def ask(request: UserRequest) -> ChatResponse:
     try:
         logger.info("\nReceived ask request: %s", request)
         response = await chat_service.chat(
-            user_input=request.user_input, session_id=request.session_id
+            user_input=request.user_input,
+            session_id=request.session_id,
+            filters=request.filters,
         )
 
         logger.debug("\nRequest retrieved: %s", response)
@@ -35,6 +38,9 @@ async def ask(request: UserRequest) -> ChatResponse:
             user_input=response.user_input,
             response_model=response.response_model,
         )
+    except NoMatchingChunksError as e:
+        logger.info("\nNo chunks matched the request filters: %s", e)
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.error("\nAn error occurred in chat interaction: %s", e)
         raise e
@@ -1,7 +1,10 @@
 """Data models for API request and response payloads."""
 
+from typing import Optional
+
 from pydantic import BaseModel
 from src.backend.services.chat_service.models.models import AIChatOutput
+from src.backend.services.vector_service.models.models import SearchFilter
 
 
 class UserRequest(BaseModel):
@@ -9,6 +12,7 @@ class UserRequest(BaseModel):
 
     session_id: str
     user_input: str
+    filters: Optional[SearchFilter] = None
 
 
 class ChatResponse(BaseModel):
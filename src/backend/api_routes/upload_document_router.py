@@ -19,14 +19,14 @@ async def upload_documents(
     session_id: str = Form(...),
     files: List[UploadFile] = File(...),
 ) -> dict:
-    """Endpoint to receive uploaded files, index them with FAISS, and persist them per session.
+    """Endpoint to receive uploaded files, index them in the vector store, and persist them per session.
 
     Inputs:
     session_id: Unique session identifier to associate with the indexed documents
     files: List of uploaded files (PDF or TXT) provided via multipart form-data
 
     Returns:
-    dict: Summary of indexing results containing the session_id, indexed file names, and total chunk count
+    dict: Summary of indexing results with the session_id, batch_id, indexed file names, and total chunk count
     """
     try:
         logger.info("Uploading %d file(s) for session_id=%s", len(files), session_id)
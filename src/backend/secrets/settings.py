@@ -1,5 +1,7 @@
 """Application settings loaded from environment variables or a .env file."""
 
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import find_dotenv
 from pydantic import SecretStr
@@ -19,6 +21,12 @@ class Settings(BaseSettings):
 
     TOP_K: int = 5
 
+    VECTOR_BACKEND: str = "faiss"
+    FAISS_INDEX_DIR: str = "faiss_indexes"
+    QDRANT_URL: Optional[str] = None
+    QDRANT_PATH: str = "data/qdrant_storage"
+    QDRANT_COLLECTION: str = "docs"
+
     LOG_LEVEL: str = "INFO"
     API_BASE_URL: str
 
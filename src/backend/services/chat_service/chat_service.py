@@ -1,12 +1,15 @@
 """Chat service module to handle interactions with a Large Language Model (LLM) and manage chat sessions."""
 
 import logging
+from typing import Optional
+
 from langchain.prompts import PromptTemplate
 
 from src.backend.services.chat_service.models.models import ChatOutput
 from src.backend.services.chat_service.llm_builder import LLMBuilder
 from src.backend.services.chat_service.models.models import AIChatOutput
 from src.backend.services.chat_service.system_prompt import PROMPT, PROMPT_VARIABLES
+from src.backend.services.vector_service.models.models import SearchFilter
 from src.backend.services.vector_service.vector_service import RetrievalService
 
 
@@ -27,12 +30,15 @@ class ChatService:
         self.llm = LLMBuilder.build_llm()
         self.retrieval = RetrievalService()
 
-    async def chat(self, session_id: str, user_input: str) -> ChatOutput:
+    async def chat(
+        self, session_id: str, user_input: str, filters: Optional[SearchFilter] = None
+    ) -> ChatOutput:
         """Handle a chat request, retrieve context, run the LLM chain, and return the structured response.
 
         Inputs:
-        session_id: Unique session identifier used to retrieve the correct FAISS index
+        session_id: Unique session identifier used to retrieve the session's indexed documents
         user_input: The text query provided by the user
+        filters: Optional restriction of the retrieved context by source, page range, and/or upload batch
 
         Returns:
         ChatOutput: The final structured chat response containing user input, session id, and the model output
@@ -44,7 +50,9 @@ class ChatService:
                 user_input,
             )
 
-            context, _docs = self.retrieval.top_context(session_id, user_input, k=1)
+            context, _docs = self.retrieval.top_context(
+                session_id, user_input, k=1, filters=filters
+            )
             self.logger.info(
                 "\nRetrieved context (%.80s...)", context.replace("\n", " ")
             )
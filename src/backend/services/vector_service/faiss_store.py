@@ -0,0 +1,235 @@
+"""FAISS implementation of the vector store, persisted as one directory per session."""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+import faiss
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_community.vectorstores import FAISS
+
+from src.backend.services.vector_service.models.models import SearchFilter
+from src.backend.services.vector_service.vector_store import (
+    NoMatchingChunksError,
+    SessionIndexNotFoundError,
+    VectorStore,
+)
+
+ID_SETS_FILE = "id_sets.json"
+FILTER_FIELDS = ("source", "page", "batch_id")
+
+# field -> metadata value (as str) -> FAISS ids of the chunks carrying that value
+IdSets = Dict[str, Dict[str, List[int]]]
+
+
+class FaissVectorStore(VectorStore):
+    """Stores each session in a local FAISS index saved under 'index_root/<session_id>'.
+
+    Alongside the index, each session keeps precomputed id sets per 'source', 'page' and 'batch_id'. Filtered
+    searches turn them into a FAISS id selector, so non-matching vectors are skipped inside the search itself
+    instead of over-fetching and post-filtering. The id sets file records the index size it was built for and is
+    rebuilt from the docstore whenever it is missing or out of date.
+    """
+
+    def __init__(self, embeddings: Embeddings, index_root: str) -> None:
+        """Stores the embeddings client and ensures the index root directory exists.
+
+        Inputs:
+        embeddings: Embeddings client used to vectorize chunks and queries.
+        index_root: Directory where the per-session indexes are persisted.
+
+        Returns:
+        None
+        """
+        self.embeddings = embeddings
+        self.index_root = index_root
+        os.makedirs(index_root, exist_ok=True)
+
+    def add_texts(self, session_id: str, texts: List[str], metadatas: List[dict]) -> None:
+        """Adds chunks to the session's FAISS index, creating and persisting it.
+
+        Inputs:
+        session_id: Unique session identifier used to locate the FAISS index directory.
+        texts: Chunk texts to embed and store.
+        metadatas: Metadata dicts aligned with 'texts'.
+
+        Returns:
+        None
+        """
+        vs = self._load_index(session_id)
+        if vs is None:
+            vs = FAISS.from_texts(texts, embedding=self.embeddings, metadatas=metadatas)
+            id_sets: IdSets = {field: {} for field in FILTER_FIELDS}
+            first_id = 0
+        else:
+            id_sets = self._load_id_sets(session_id, vs)
+            first_id = vs.index.ntotal
+            vs.add_texts(texts, metadatas=metadatas)
+
+        self._add_to_id_sets(id_sets, first_id, metadatas)
+        self._save_index(session_id, vs)
+        self._save_id_sets(session_id, id_sets, vs.index.ntotal)
+
+    def similarity_search(
+        self, session_id: str, query: str, k: int = 1, filters: Optional[SearchFilter] = None
+    ) -> List[Document]:
+        """Loads the session's FAISS index and runs a similarity search, optionally restricted by filters.
+
+        Inputs:
+        session_id: Unique session identifier linked to the persisted FAISS index.
+        query: Natural-language query used to search similar chunks.
+        k: Number of top documents to retrieve.
+        filters: Optional metadata filter applied through a FAISS id selector.
+
+        Returns:
+        List[Document]: Retrieved chunks ordered by similarity.
+        """
+        vs = self._load_index(session_id)
+        if vs is None:
+            raise SessionIndexNotFoundError()
+        if filters is None or filters.is_empty():
+            return vs.similarity_search(query, k=k)
+
+        allowed = self._select_ids(self._load_id_sets(session_id, vs), filters)
+        if allowed.size == 0:
+            raise NoMatchingChunksError(filters)
+
+        query_vector = np.array([self.embeddings.embed_query(query)], dtype=np.float32)
+        params = faiss.SearchParameters(sel=faiss.IDSelectorBatch(allowed))
+        _distances, ids = vs.index.search(query_vector, min(k, allowed.size), params=params)
+
+        docs = []
+        for i in ids[0]:
+            if i == -1:
+                continue
+            doc = vs.docstore.search(vs.index_to_docstore_id[int(i)])
+            if isinstance(doc, Document):
+                docs.append(doc)
+        if not docs:
+            raise NoMatchingChunksError(filters)
+        return docs
+
+    def _index_dir(self, session_id: str) -> str:
+        """Builds the absolute path to the FAISS index directory for a given session.
+
+        Inputs:
+        session_id: Unique session identifier.
+
+        Returns:
+        str: Absolute path to the session-specific index folder.
+        """
+        return os.path.join(self.index_root, session_id)
+
+    def _load_index(self, session_id: str) -> Optional[FAISS]:
+        """Loads a FAISS vector store from disk for the given session if present.
+
+        Inputs:
+        session_id: Unique session identifier whose index should be loaded.
+
+        Returns:
+        FAISS | None: Loaded vector store or None if the index directory does not exist.
+        """
+        index_dir = self._index_dir(session_id)
+        if not os.path.exists(index_dir):
+            return None
+        return FAISS.load_local(
+            index_dir,
+            self.embeddings,
+            allow_dangerous_deserialization=True,
+        )
+
+    def _save_index(self, session_id: str, vs: FAISS) -> None:
+        """Persists the FAISS vector store to the session-specific directory.
+
+        Inputs:
+        session_id: Unique session identifier whose index directory will be used.
+        vs: FAISS vector store to save.
+
+        Returns:
+        None
+        """
+        vs.save_local(self._index_dir(session_id))
+
+    def _load_id_sets(self, session_id: str, vs: FAISS) -> IdSets:
+        """Loads the session's precomputed id sets, rebuilding and saving them if missing or stale.
+
+        Inputs:
+        session_id: Unique session identifier whose id sets should be loaded.
+        vs: Loaded FAISS vector store of the session, whose size the id sets must match.
+
+        Returns:
+        IdSets: Mapping of field -> value -> FAISS ids.
+        """
+        path = os.path.join(self._index_dir(session_id), ID_SETS_FILE)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("ntotal") == vs.index.ntotal:
+                return stored["sets"]
+
+        id_sets: IdSets = {field: {} for field in FILTER_FIELDS}
+        for faiss_id, doc_id in vs.index_to_docstore_id.items():
+            doc = vs.docstore.search(doc_id)
+            if isinstance(doc, Document):
+                self._add_to_id_sets(id_sets, faiss_id, [doc.metadata])
+        self._save_id_sets(session_id, id_sets, vs.index.ntotal)
+        return id_sets
+
+    def _save_id_sets(self, session_id: str, id_sets: IdSets, ntotal: int) -> None:
+        """Persists the session's id sets next to its FAISS index, tagged with the index size they cover.
+
+        Inputs:
+        session_id: Unique session identifier whose index directory will be used.
+        id_sets: Mapping of field -> value -> FAISS ids.
+        ntotal: Number of vectors in the index the id sets were built for.
+
+        Returns:
+        None
+        """
+        with open(os.path.join(self._index_dir(session_id), ID_SETS_FILE), "w", encoding="utf-8") as f:
+            json.dump({"ntotal": ntotal, "sets": id_sets}, f)
+
+    def _add_to_id_sets(self, id_sets: IdSets, first_id: int, metadatas: List[dict]) -> None:
+        """Registers consecutive FAISS ids, starting at 'first_id', under their metadata values.
+
+        Inputs:
+        id_sets: Mapping of field -> value -> FAISS ids, updated in place.
+        first_id: FAISS id assigned to the first metadata entry.
+        metadatas: Metadata dicts in insertion order.
+
+        Returns:
+        None
+        """
+        for offset, meta in enumerate(metadatas):
+            for field in FILTER_FIELDS:
+                value = meta.get(field)
+                if value is not None:
+                    id_sets[field].setdefault(str(value), []).append(first_id + offset)
+
+    def _select_ids(self, id_sets: IdSets, filters: SearchFilter) -> np.ndarray:
+        """Intersects the id sets matching every filter value.
+
+        Inputs:
+        id_sets: Mapping of field -> value -> FAISS ids.
+        filters: Filter whose set values must all match.
+
+        Returns:
+        np.ndarray: Sorted int64 array of the FAISS ids allowed in the search.
+        """
+        selections = []
+        if filters.source is not None:
+            selections.append(np.asarray(id_sets["source"].get(filters.source, []), dtype=np.int64))
+        if filters.batch_id is not None:
+            selections.append(np.asarray(id_sets["batch_id"].get(filters.batch_id, []), dtype=np.int64))
+        if filters.page_from is not None or filters.page_to is not None:
+            low = filters.page_from if filters.page_from is not None else float("-inf")
+            high = filters.page_to if filters.page_to is not None else float("inf")
+            pages = [ids for page, ids in id_sets["page"].items() if low <= int(page) <= high]
+            selections.append(np.asarray([i for ids in pages for i in ids], dtype=np.int64))
+
+        allowed = np.unique(selections[0])
+        for selection in selections[1:]:
+            allowed = np.intersect1d(allowed, selection)
+        return allowed
@@ -0,0 +1,27 @@
+"""Models for vector service retrieval."""
+
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional
+
+
+class SearchFilter(BaseModel):
+    """Restricts a retrieval to chunks matching all of the given metadata values."""
+
+    source: Optional[str] = Field(default=None, description="File name the chunks must come from.")
+    page_from: Optional[int] = Field(default=None, description="First page (inclusive) of the page range.")
+    page_to: Optional[int] = Field(default=None, description="Last page (inclusive) of the page range.")
+    batch_id: Optional[str] = Field(default=None, description="Upload batch the chunks must belong to.")
+
+    @model_validator(mode="after")
+    def check_page_range(self) -> "SearchFilter":
+        """Ensures pages are 1-based and the range is not reversed."""
+        for page in (self.page_from, self.page_to):
+            if page is not None and page < 1:
+                raise ValueError("page_from and page_to must be >= 1")
+        if self.page_from is not None and self.page_to is not None and self.page_from > self.page_to:
+            raise ValueError("page_from must be <= page_to")
+        return self
+
+    def is_empty(self) -> bool:
+        """Returns True when no filter value is set."""
+        return all(value is None for value in (self.source, self.page_from, self.page_to, self.batch_id))
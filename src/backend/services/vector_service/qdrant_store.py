@@ -0,0 +1,217 @@
+"""Qdrant implementation of the vector store, sharing one collection across sessions."""
+
+import uuid
+from typing import List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from qdrant_client import QdrantClient, models
+
+from src.backend.services.vector_service.models.models import SearchFilter
+from src.backend.services.vector_service.vector_store import (
+    NoMatchingChunksError,
+    SessionIndexNotFoundError,
+    VectorStore,
+)
+
+SESSION_KEY = "session_id"
+CONTENT_KEY = "page_content"
+
+PAYLOAD_INDEXES = {
+    SESSION_KEY: models.PayloadSchemaType.KEYWORD,
+    "source": models.PayloadSchemaType.KEYWORD,
+    "page": models.PayloadSchemaType.INTEGER,
+    "batch_id": models.PayloadSchemaType.KEYWORD,
+}
+
+
+class QdrantVectorStore(VectorStore):
+    """Stores all sessions in a single Qdrant collection, isolated by a 'session_id' payload filter.
+
+    Works against a Qdrant server as well as the embedded local mode (on-disk path or in-memory). Vectors are
+    compared with Euclidean distance, the same metric as the FAISS backend, so both rank chunks alike.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        client: QdrantClient,
+        collection: str,
+        create_payload_indexes: bool = True,
+    ) -> None:
+        """Stores the embeddings client and the Qdrant client/collection to operate on.
+
+        Inputs:
+        embeddings: Embeddings client used to vectorize chunks and queries.
+        client: Qdrant client, either server-backed or in local mode.
+        collection: Name of the collection holding the chunks.
+        create_payload_indexes: Whether to index the filtered payload fields; local mode does not support it.
+
+        Returns:
+        None
+        """
+        self.embeddings = embeddings
+        self.client = client
+        self.collection = collection
+        self.create_payload_indexes = create_payload_indexes
+        self._collection_ready = False
+
+    def add_texts(self, session_id: str, texts: List[str], metadatas: List[dict]) -> None:
+        """Embeds the chunks and upserts them as points tagged with the session id.
+
+        Inputs:
+        session_id: Unique session identifier that owns the chunks.
+        texts: Chunk texts to embed and store.
+        metadatas: Metadata dicts aligned with 'texts'.
+
+        Returns:
+        None
+        """
+        if not texts:
+            return
+
+        vectors = self.embeddings.embed_documents(texts)
+        self._ensure_collection(len(vectors[0]))
+
+        points = [
+            models.PointStruct(
+                id=uuid.uuid4().hex,
+                vector=vector,
+                payload={**meta, SESSION_KEY: session_id, CONTENT_KEY: text},
+            )
+            for text, meta, vector in zip(texts, metadatas, vectors)
+        ]
+        self.client.upsert(collection_name=self.collection, points=points)
+
+    def similarity_search(
+        self, session_id: str, query: str, k: int = 1, filters: Optional[SearchFilter] = None
+    ) -> List[Document]:
+        """Runs a similarity search restricted to the session's points and the optional metadata filters.
+
+        Inputs:
+        session_id: Unique session identifier whose chunks should be searched.
+        query: Natural-language query used to search similar chunks.
+        k: Number of top documents to retrieve.
+        filters: Optional metadata filter, applied as indexed payload conditions during the search.
+
+        Returns:
+        List[Document]: Retrieved chunks ordered by similarity.
+        """
+        if not self._collection_exists():
+            raise SessionIndexNotFoundError()
+
+        session_filter = self._session_filter(session_id)
+        result = self.client.query_points(
+            collection_name=self.collection,
+            query=self.embeddings.embed_query(query),
+            query_filter=self._search_filter(session_filter, filters),
+            limit=k,
+            with_payload=True,
+        )
+        if not result.points:
+            if not self._has_points(session_filter):
+                raise SessionIndexNotFoundError()
+            if filters is not None and not filters.is_empty():
+                raise NoMatchingChunksError(filters)
+        return [self._to_document(point.payload or {}) for point in result.points]
+
+    def _ensure_collection(self, dim: int) -> None:
+        """Creates the collection and, on a Qdrant server, its payload indexes on first use.
+
+        Inputs:
+        dim: Dimension of the embedding vectors.
+
+        Returns:
+        None
+        """
+        if self._collection_exists():
+            return
+        self.client.create_collection(
+            collection_name=self.collection,
+            vectors_config=models.VectorParams(size=dim, distance=models.Distance.EUCLID),
+        )
+        self._collection_ready = True
+        if not self.create_payload_indexes:
+            return
+        for field_name, field_schema in PAYLOAD_INDEXES.items():
+            self.client.create_payload_index(
+                collection_name=self.collection,
+                field_name=field_name,
+                field_schema=field_schema,
+            )
+
+    def _collection_exists(self) -> bool:
+        """Checks whether the collection exists, asking Qdrant only until it has been seen once.
+
+        Inputs:
+        None
+
+        Returns:
+        bool: True if the collection exists.
+        """
+        if not self._collection_ready:
+            self._collection_ready = self.client.collection_exists(self.collection)
+        return self._collection_ready
+
+    def _has_points(self, query_filter: models.Filter) -> bool:
+        """Checks whether any point matches the filter, using an exact count.
+
+        Inputs:
+        query_filter: Qdrant filter to count points against.
+
+        Returns:
+        bool: True if at least one point matches.
+        """
+        count = self.client.count(
+            collection_name=self.collection, count_filter=query_filter, exact=True
+        )
+        return count.count > 0
+
+    def _session_filter(self, session_id: str) -> models.Filter:
+        """Builds the payload filter selecting a single session's points.
+
+        Inputs:
+        session_id: Unique session identifier.
+
+        Returns:
+        models.Filter: Filter matching the session id.
+        """
+        return models.Filter(
+            must=[models.FieldCondition(key=SESSION_KEY, match=models.MatchValue(value=session_id))]
+        )
+
+    def _search_filter(self, session_filter: models.Filter, filters: Optional[SearchFilter]) -> models.Filter:
+        """Extends the session filter with the conditions of the metadata filter.
+
+        Inputs:
+        session_filter: Filter selecting the session's points.
+        filters: Optional metadata filter to add.
+
+        Returns:
+        models.Filter: Filter matching the session and every set metadata value.
+        """
+        if filters is None or filters.is_empty():
+            return session_filter
+
+        conditions = list(session_filter.must or [])
+        if filters.source is not None:
+            conditions.append(models.FieldCondition(key="source", match=models.MatchValue(value=filters.source)))
+        if filters.batch_id is not None:
+            conditions.append(models.FieldCondition(key="batch_id", match=models.MatchValue(value=filters.batch_id)))
+        if filters.page_from is not None or filters.page_to is not None:
+            conditions.append(
+                models.FieldCondition(key="page", range=models.Range(gte=filters.page_from, lte=filters.page_to))
+            )
+        return models.Filter(must=conditions)
+
+    def _to_document(self, payload: dict) -> Document:
+        """Converts a point payload back into a LangChain Document.
+
+        Inputs:
+        payload: Point payload as stored by 'add_texts'.
+
+        Returns:
+        Document: Document with the chunk text and its original metadata.
+        """
+        metadata = {key: value for key, value in payload.items() if key not in (SESSION_KEY, CONTENT_KEY)}
+        return Document(page_content=payload.get(CONTENT_KEY, ""), metadata=metadata)
@@ -2,26 +2,26 @@
 
 # from __future__ import annotations
 import io
-import os
-from typing import List, Tuple
+import uuid
+from typing import List, Optional, Tuple
 
 from PyPDF2 import PdfReader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
-from langchain_community.vectorstores import FAISS
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
 from src.backend.secrets.settings import settings
+from src.backend.services.vector_service.models.models import SearchFilter
+from src.backend.services.vector_service.vector_store_builder import VectorStoreBuilder
 
-INDEX_ROOT = os.path.join(os.getcwd(), "faiss_indexes")
 EMBED_MODEL = settings.EMBEDDING_MODEL
 
 
 class RetrievalService:
     """Handles per-session vector operations.
 
-    Parses uploaded files (PDF/TXT), chunks text. Builds/updates a local FAISS index, persists it on disk, and
-    retrieves the most relevant chunk(s) for a user query.
+    Parses uploaded files (PDF/TXT), chunks text. Stores the chunks in the configured vector store backend
+    (FAISS or Qdrant), and retrieves the most relevant chunk(s) for a user query.
 
     Inputs:
     None
@@ -31,7 +31,7 @@ class RetrievalService:
     """
 
     def __init__(self) -> None:
-        """Initializes the embeddings client and ensures the index root directory exists.
+        """Initializes the embeddings client and the configured vector store.
 
         Inputs:
         None
@@ -43,101 +43,54 @@ class RetrievalService:
             model=EMBED_MODEL,
             google_api_key=settings.GEMINI_API_KEY,
         )
-        os.makedirs(INDEX_ROOT, exist_ok=True)
+        self.store = VectorStoreBuilder.build_vector_store(self.embeddings)
 
     def upsert_files(self, session_id: str, files: List[Tuple[str, bytes]]) -> dict:
-        """Indexes uploaded files into the session's FAISS vector store.
+        """Indexes uploaded files into the session's vector store.
 
         Inputs:
-        session_id: Unique session identifier used to locate the FAISS index directory.
+        session_id: Unique session identifier that owns the indexed chunks.
         files: List of tuples (filename, file_bytes) to parse and index. Supports PDF and TXT.
 
         Returns:
-        dict: Summary with session_id, list of files indexed, and total number of chunks stored.
+        dict: Summary with session_id, upload batch_id, list of files indexed, and total number of chunks stored.
         """
+        batch_id = uuid.uuid4().hex
         texts, metadatas = self._extract_texts_with_meta(files)
         chunk_texts, chunk_metas = self._split_with_meta(texts, metadatas)
+        for meta in chunk_metas:
+            meta["batch_id"] = batch_id
 
-        vs = self._load_index(session_id)
-        if vs is None:
-            vs = FAISS.from_texts(
-                chunk_texts,
-                embedding=self.embeddings,
-                metadatas=chunk_metas,
-            )
-        else:
-            vs.add_texts(chunk_texts, metadatas=chunk_metas)
-
-        self._save_index(session_id, vs)
+        self.store.add_texts(session_id, chunk_texts, chunk_metas)
 
         return {
             "session_id": session_id,
+            "batch_id": batch_id,
             "files_indexed": list({m["source"] for m in chunk_metas}),
             "chunks_count": len(chunk_texts),
         }
 
     def top_context(
-        self, session_id: str, query: str, k: int = 1
+        self, session_id: str, query: str, k: int = 1, filters: Optional[SearchFilter] = None
     ) -> Tuple[str, List[Document]]:
         """Retrieve top-k relevant chunks and formatted context for a query.
 
         Inputs:
-        session_id: Unique session identifier linked to the persisted FAISS index.
+        session_id: Unique session identifier whose indexed chunks are searched.
         query: Natural-language query used to search similar chunks.
         k: Number of top documents to retrieve (defaults to 1).
+        filters: Optional restriction by source, page range, and/or upload batch_id.
 
         Returns:
         Tuple[str, List[Document]]: (formatted context string, list of LangChain Documents).
-        """
-        vs = self._load_index(session_id)
-        if vs is None:
-            raise RuntimeError("No index for this session. Upload documents first.")
 
-        docs = vs.similarity_search(query, k=k)
+        Raises:
+        NoMatchingChunksError: If filters are given and no chunk of the session matches them.
+        """
+        docs = self.store.similarity_search(session_id, query, k=k, filters=filters)
         context = self._format_context(docs)
         return context, docs
 
-    def _index_dir(self, session_id: str) -> str:
-        """Builds the absolute path to the FAISS index directory for a given session.
-
-        Inputs:
-        session_id: Unique session identifier.
-
-        Returns:
-        str: Absolute path to the session-specific index folder.
-        """
-        return os.path.join(INDEX_ROOT, session_id)
-
-    def _load_index(self, session_id: str):
-        """Loads a FAISS vector store from disk for the given session if present.
-
-        Inputs:
-        session_id: Unique session identifier whose index should be loaded.
-
-        Returns:
-        FAISS | None: Loaded vector store or None if the index directory does not exist.
-        """
-        index_dir = self._index_dir(session_id)
-        if not os.path.exists(index_dir):
-            return None
-        return FAISS.load_local(
-            index_dir,
-            self.embeddings,
-            allow_dangerous_deserialization=True,
-        )
-
-    def _save_index(self, session_id: str, vs: FAISS) -> None:
-        """Persists the FAISS vector store to the session-specific directory.
-
-        Inputs:
-        session_id: Unique session identifier whose index directory will be used.
-        vs: FAISS vector store to save.
-
-        Returns:
-        None
-        """
-        vs.save_local(self._index_dir(session_id))
-
     def _extract_texts_with_meta(
         self, files: List[Tuple[str, bytes]]
     ) -> Tuple[List[str], List[dict]]:
@@ -0,0 +1,79 @@
+"""Vector store interface shared by the retrieval backends."""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from langchain_core.documents import Document
+
+from src.backend.services.vector_service.models.models import SearchFilter
+
+
+class SessionIndexNotFoundError(RuntimeError):
+    """Raised when a session has no indexed documents in the vector store."""
+
+    def __init__(self) -> None:
+        """Initializes the error with the default message.
+
+        Inputs:
+        None
+
+        Returns:
+        None
+        """
+        super().__init__("No index for this session. Upload documents first.")
+
+
+class NoMatchingChunksError(LookupError):
+    """Raised when a filtered search matches no chunk of the session."""
+
+    def __init__(self, filters: SearchFilter) -> None:
+        """Initializes the error with a message describing the filter.
+
+        Inputs:
+        filters: Filter that matched no chunk.
+
+        Returns:
+        None
+        """
+        super().__init__(f"No indexed chunks match the filters: {filters.model_dump(exclude_none=True)}")
+
+
+class VectorStore(ABC):
+    """Abstract per-session vector store used by the RetrievalService.
+
+    Implementations are responsible for embedding, persisting, and searching chunks, keeping
+    each session's documents isolated from the others.
+    """
+
+    @abstractmethod
+    def add_texts(self, session_id: str, texts: List[str], metadatas: List[dict]) -> None:
+        """Embeds and stores chunks for a session, creating its index if needed.
+
+        Inputs:
+        session_id: Unique session identifier that owns the chunks.
+        texts: Chunk texts to embed and store.
+        metadatas: Metadata dicts aligned with 'texts'.
+
+        Returns:
+        None
+        """
+
+    @abstractmethod
+    def similarity_search(
+        self, session_id: str, query: str, k: int = 1, filters: Optional[SearchFilter] = None
+    ) -> List[Document]:
+        """Returns the k chunks of a session most similar to the query.
+
+        Inputs:
+        session_id: Unique session identifier whose chunks should be searched.
+        query: Natural-language query used to search similar chunks.
+        k: Number of top documents to retrieve.
+        filters: Optional metadata filter; only matching chunks are considered by the search.
+
+        Returns:
+        List[Document]: Retrieved chunks ordered by similarity.
+
+        Raises:
+        SessionIndexNotFoundError: If the session has no indexed documents.
+        NoMatchingChunksError: If filters are given and no chunk of the session matches them.
+        """
@@ -0,0 +1,81 @@
+"""Module for creating the configured vector store backend."""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+from langchain_core.embeddings import Embeddings
+
+from src.backend.secrets.settings import settings
+from src.backend.services.vector_service.vector_store import VectorStore
+
+
+class VectorStoreBuilder:
+    """Class to build the vector store selected by the VECTOR_BACKEND setting."""
+
+    def __init__(self):
+        """Prevent direct instantiation of this class.
+
+        Inputs:
+        None
+
+        Returns:
+        Raises a TypeError to enforce usage of the static method
+        """
+        raise TypeError(
+            "This class is not intended to be instantiated directly. "
+            "Use its static method directly from the class itself."
+        )
+
+    @staticmethod
+    def build_vector_store(embeddings: Embeddings) -> VectorStore:
+        """Build and return the vector store configured in settings.
+
+        Inputs:
+        embeddings: Embeddings client used by the store to vectorize chunks and queries
+
+        Returns:
+        VectorStore: A FAISS or Qdrant backed store, depending on VECTOR_BACKEND
+        """
+        backend = settings.VECTOR_BACKEND.lower()
+
+        if backend == "faiss":
+            from src.backend.services.vector_service.faiss_store import FaissVectorStore
+
+            return FaissVectorStore(embeddings, os.path.join(os.getcwd(), settings.FAISS_INDEX_DIR))
+
+        if backend == "qdrant":
+            from src.backend.services.vector_service.qdrant_store import QdrantVectorStore
+
+            client = _qdrant_client(settings.QDRANT_URL, settings.QDRANT_PATH)
+            # payload indexes are only supported by a Qdrant server, not by the local mode
+            return QdrantVectorStore(
+                embeddings,
+                client,
+                settings.QDRANT_COLLECTION,
+                create_payload_indexes=bool(settings.QDRANT_URL),
+            )
+
+        raise ValueError(f"Unsupported VECTOR_BACKEND: {settings.VECTOR_BACKEND}")
+
+
+@lru_cache(maxsize=None)
+def _qdrant_client(url: Optional[str], path: str):
+    """Return a process-wide Qdrant client for the given location.
+
+    Local mode locks its storage folder, so every service in the process must share one client.
+
+    Inputs:
+    url: Qdrant server URL; when unset the embedded local mode is used
+    path: Storage folder for local mode, or ':memory:' for a non-persistent store
+
+    Returns:
+    QdrantClient: Client connected to the server or the local storage
+    """
+    from qdrant_client import QdrantClient
+
+    if url:
+        return QdrantClient(url=url)
+    if path == ":memory:":
+        return QdrantClient(location=":memory:")
+    return QdrantClient(path=path)
@@ -0,0 +1,6 @@
+"""Test package; provides the required settings so application modules can be imported offline."""
+
+import os
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ.setdefault("API_BASE_URL", "http://localhost:8000")
@@ -0,0 +1,45 @@
+"""Tests for the chat route's handling of retrieval filters."""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from src.backend.api_routes import chat_router
+from src.backend.api_routes.models.models import UserRequest
+from src.backend.services.vector_service.models.models import SearchFilter
+from src.backend.services.vector_service.vector_store import NoMatchingChunksError
+
+
+class TestUserRequest(unittest.TestCase):
+    def test_filters_are_optional(self):
+        self.assertIsNone(UserRequest(session_id="s", user_input="q").filters)
+
+    def test_valid_filters_are_parsed(self):
+        request = UserRequest(session_id="s", user_input="q", filters={"source": "a.pdf", "page_from": 2})
+
+        self.assertEqual(request.filters, SearchFilter(source="a.pdf", page_from=2))
+
+    def test_reversed_page_range_fails_validation(self):
+        with self.assertRaises(ValidationError):
+            UserRequest(session_id="s", user_input="q", filters={"page_from": 5, "page_to": 1})
+
+
+class TestAsk(unittest.TestCase):
+    def test_no_matching_chunks_returns_404(self):
+        filters = SearchFilter(source="missing.pdf")
+        request = UserRequest(session_id="s", user_input="q", filters=filters)
+        chat = AsyncMock(side_effect=NoMatchingChunksError(filters))
+
+        with patch.object(chat_router.chat_service, "chat", chat):
+            with self.assertRaises(HTTPException) as ctx:
+                asyncio.run(chat_router.ask(request))
+
+        self.assertEqual(ctx.exception.status_code, 404)
+        chat.assert_awaited_once_with(user_input="q", session_id="s", filters=filters)
+
+
+if __name__ == "__main__":
+    unittest.main()
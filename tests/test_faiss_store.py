@@ -0,0 +1,136 @@
+"""Tests for the FAISS vector store and its precomputed filter id sets."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.backend.services.vector_service.faiss_store import ID_SETS_FILE, FaissVectorStore
+from src.backend.services.vector_service.models.models import SearchFilter
+from src.backend.services.vector_service.vector_store import NoMatchingChunksError, SessionIndexNotFoundError
+
+SESSION_ID = "session"
+
+
+def chunks(source, batch_id, pages):
+    """Build (texts, metadatas) for one chunk per page of a source file."""
+    texts = [f"{source} page {page}" for page in pages]
+    metas = [{"source": source, "page": page, "batch_id": batch_id} for page in pages]
+    return texts, metas
+
+
+class TestFaissVectorStore(unittest.TestCase):
+    def setUp(self):
+        self.index_root = tempfile.mkdtemp()
+        self.store = FaissVectorStore(DeterministicFakeEmbedding(size=16), self.index_root)
+        # three uploads, so the id offsets of the second and third batches are exercised
+        self.store.add_texts(SESSION_ID, *chunks("a.pdf", "batch-1", range(1, 6)))
+        self.store.add_texts(SESSION_ID, *chunks("b.pdf", "batch-2", range(1, 6)))
+        self.store.add_texts(SESSION_ID, *chunks("c.pdf", "batch-3", range(1, 4)))
+
+    def tearDown(self):
+        shutil.rmtree(self.index_root)
+
+    def search(self, **filters):
+        docs = self.store.similarity_search(SESSION_ID, "page", k=100, filters=SearchFilter(**filters))
+        return sorted(doc.page_content for doc in docs)
+
+    def id_sets_path(self):
+        return os.path.join(self.index_root, SESSION_ID, ID_SETS_FILE)
+
+    def test_unfiltered_search_sees_every_batch(self):
+        docs = self.store.similarity_search(SESSION_ID, "page", k=100)
+
+        self.assertEqual(len(docs), 13)
+
+    def test_filter_by_source(self):
+        self.assertEqual(self.search(source="b.pdf"), [f"b.pdf page {page}" for page in range(1, 6)])
+
+    def test_filter_by_batch(self):
+        self.assertEqual(self.search(batch_id="batch-3"), [f"c.pdf page {page}" for page in range(1, 4)])
+
+    def test_filter_by_page_range(self):
+        self.assertEqual(
+            self.search(page_from=2, page_to=3),
+            ["a.pdf page 2", "a.pdf page 3", "b.pdf page 2", "b.pdf page 3", "c.pdf page 2", "c.pdf page 3"],
+        )
+
+    def test_open_ended_page_range(self):
+        self.assertEqual(self.search(page_from=5), ["a.pdf page 5", "b.pdf page 5"])
+        self.assertEqual(self.search(page_to=1), ["a.pdf page 1", "b.pdf page 1", "c.pdf page 1"])
+
+    def test_combined_filters_intersect(self):
+        self.assertEqual(self.search(source="b.pdf", page_from=4, page_to=5), ["b.pdf page 4", "b.pdf page 5"])
+        self.assertEqual(self.search(source="c.pdf", batch_id="batch-3", page_to=1), ["c.pdf page 1"])
+
+    def test_filtered_search_respects_k(self):
+        docs = self.store.similarity_search(SESSION_ID, "page", k=2, filters=SearchFilter(source="a.pdf"))
+
+        self.assertEqual(len(docs), 2)
+        self.assertTrue(all(doc.metadata["source"] == "a.pdf" for doc in docs))
+
+    def test_empty_match_raises(self):
+        with self.assertRaises(NoMatchingChunksError):
+            self.search(source="missing.pdf")
+        with self.assertRaises(NoMatchingChunksError):
+            self.search(source="c.pdf", batch_id="batch-1")
+        with self.assertRaises(NoMatchingChunksError):
+            self.search(page_from=6)
+
+    def test_unknown_session_raises(self):
+        with self.assertRaises(SessionIndexNotFoundError):
+            self.store.similarity_search("missing", "page", filters=SearchFilter(source="a.pdf"))
+
+    def test_id_sets_record_index_size(self):
+        with open(self.id_sets_path(), encoding="utf-8") as f:
+            stored = json.load(f)
+
+        self.assertEqual(stored["ntotal"], 13)
+        self.assertEqual(stored["sets"]["batch_id"]["batch-2"], [5, 6, 7, 8, 9])
+
+    def test_missing_id_sets_are_rebuilt_and_saved(self):
+        os.remove(self.id_sets_path())
+
+        self.assertEqual(self.search(source="c.pdf", page_from=2), ["c.pdf page 2", "c.pdf page 3"])
+        self.assertTrue(os.path.exists(self.id_sets_path()))
+
+    def test_stale_id_sets_are_rebuilt(self):
+        with open(self.id_sets_path(), encoding="utf-8") as f:
+            stored = json.load(f)
+        stored["ntotal"] = 10
+        del stored["sets"]["source"]["c.pdf"]
+        with open(self.id_sets_path(), "w", encoding="utf-8") as f:
+            json.dump(stored, f)
+
+        self.assertEqual(self.search(source="c.pdf"), [f"c.pdf page {page}" for page in range(1, 4)])
+
+    def test_upload_after_missing_id_sets_keeps_all_batches(self):
+        os.remove(self.id_sets_path())
+        self.store.add_texts(SESSION_ID, *chunks("d.pdf", "batch-4", [1]))
+
+        self.assertEqual(self.search(page_to=1), ["a.pdf page 1", "b.pdf page 1", "c.pdf page 1", "d.pdf page 1"])
+
+
+class TestSearchFilter(unittest.TestCase):
+    def test_valid_page_range(self):
+        self.assertFalse(SearchFilter(page_from=1, page_to=1).is_empty())
+
+    def test_empty_filter(self):
+        self.assertTrue(SearchFilter().is_empty())
+
+    def test_reversed_page_range_is_rejected(self):
+        with self.assertRaises(ValueError):
+            SearchFilter(page_from=5, page_to=1)
+
+    def test_non_positive_pages_are_rejected(self):
+        with self.assertRaises(ValueError):
+            SearchFilter(page_from=0)
+        with self.assertRaises(ValueError):
+            SearchFilter(page_to=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
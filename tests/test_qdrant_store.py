@@ -0,0 +1,133 @@
+"""Tests for the Qdrant vector store running in local in-memory mode."""
+
+import unittest
+import warnings
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from qdrant_client import QdrantClient
+
+from src.backend.services.vector_service.models.models import SearchFilter
+from src.backend.services.vector_service.qdrant_store import QdrantVectorStore
+from src.backend.services.vector_service.vector_store import NoMatchingChunksError, SessionIndexNotFoundError
+
+
+def make_store(collection="test"):
+    """Build an in-memory store; local mode does not support payload indexes."""
+    return QdrantVectorStore(
+        DeterministicFakeEmbedding(size=16),
+        QdrantClient(location=":memory:"),
+        collection,
+        create_payload_indexes=False,
+    )
+
+
+class TestQdrantVectorStore(unittest.TestCase):
+    def setUp(self):
+        self.store = make_store()
+        self.store.add_texts(
+            "session-a",
+            ["alpha one", "alpha two", "alpha three"],
+            [{"source": "a.pdf", "page": i + 1} for i in range(3)],
+        )
+        self.store.add_texts("session-b", ["beta one"], [{"source": "b.pdf", "page": 1}])
+
+    def test_similarity_search_returns_stored_chunks_with_metadata(self):
+        docs = self.store.similarity_search("session-a", "alpha two", k=1)
+
+        self.assertEqual(len(docs), 1)
+        self.assertEqual(docs[0].page_content, "alpha two")
+        self.assertEqual(docs[0].metadata, {"source": "a.pdf", "page": 2})
+
+    def test_similarity_search_respects_k(self):
+        self.assertEqual(len(self.store.similarity_search("session-a", "alpha", k=2)), 2)
+
+    def test_sessions_are_isolated(self):
+        docs = self.store.similarity_search("session-a", "beta one", k=10)
+
+        self.assertEqual(len(docs), 3)
+        self.assertTrue(all(doc.metadata["source"] == "a.pdf" for doc in docs))
+        self.assertEqual(
+            [doc.page_content for doc in self.store.similarity_search("session-b", "alpha", k=10)], ["beta one"]
+        )
+
+    def test_filters_restrict_results(self):
+        docs = self.store.similarity_search("session-a", "alpha", k=10, filters=SearchFilter(page_from=2))
+
+        self.assertEqual(sorted(doc.page_content for doc in docs), ["alpha three", "alpha two"])
+
+    def test_filter_matching_nothing_raises(self):
+        with self.assertRaises(NoMatchingChunksError):
+            self.store.similarity_search("session-a", "alpha", filters=SearchFilter(source="b.pdf"))
+
+    def test_unknown_session_raises(self):
+        with self.assertRaises(SessionIndexNotFoundError):
+            self.store.similarity_search("missing", "alpha")
+
+    def test_search_before_any_upload_raises(self):
+        with self.assertRaises(SessionIndexNotFoundError):
+            make_store("empty").similarity_search("session-a", "alpha")
+
+    def test_disabled_payload_indexes_do_not_warn_in_local_mode(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            make_store("local").add_texts("session-a", ["alpha"], [{"source": "a.pdf", "page": 1}])
+
+
+class TestQdrantFilters(unittest.TestCase):
+    """Same uploads and expectations as the FAISS filter tests, so both backends are shown to agree."""
+
+    def setUp(self):
+        self.store = make_store()
+        for source, batch_id, pages in (("a.pdf", "batch-1", 5), ("b.pdf", "batch-2", 5), ("c.pdf", "batch-3", 3)):
+            self.store.add_texts(
+                "session",
+                [f"{source} page {page}" for page in range(1, pages + 1)],
+                [{"source": source, "page": page, "batch_id": batch_id} for page in range(1, pages + 1)],
+            )
+        self.store.add_texts("other", ["a.pdf page 1"], [{"source": "a.pdf", "page": 1, "batch_id": "batch-1"}])
+
+    def search(self, **filters):
+        docs = self.store.similarity_search("session", "page", k=100, filters=SearchFilter(**filters))
+        return sorted(doc.page_content for doc in docs)
+
+    def test_filter_by_source(self):
+        self.assertEqual(self.search(source="b.pdf"), [f"b.pdf page {page}" for page in range(1, 6)])
+
+    def test_filter_by_batch(self):
+        self.assertEqual(self.search(batch_id="batch-3"), [f"c.pdf page {page}" for page in range(1, 4)])
+
+    def test_filter_by_page_range(self):
+        self.assertEqual(
+            self.search(page_from=2, page_to=3),
+            ["a.pdf page 2", "a.pdf page 3", "b.pdf page 2", "b.pdf page 3", "c.pdf page 2", "c.pdf page 3"],
+        )
+
+    def test_open_ended_page_range(self):
+        self.assertEqual(self.search(page_from=5), ["a.pdf page 5", "b.pdf page 5"])
+        self.assertEqual(self.search(page_to=1), ["a.pdf page 1", "b.pdf page 1", "c.pdf page 1"])
+
+    def test_combined_filters_intersect(self):
+        self.assertEqual(self.search(source="b.pdf", page_from=4, page_to=5), ["b.pdf page 4", "b.pdf page 5"])
+        self.assertEqual(self.search(source="c.pdf", batch_id="batch-3", page_to=1), ["c.pdf page 1"])
+
+    def test_filtered_search_respects_k(self):
+        docs = self.store.similarity_search("session", "page", k=2, filters=SearchFilter(source="a.pdf"))
+
+        self.assertEqual(len(docs), 2)
+        self.assertTrue(all(doc.metadata["source"] == "a.pdf" for doc in docs))
+
+    def test_empty_match_raises(self):
+        with self.assertRaises(NoMatchingChunksError):
+            self.search(source="missing.pdf")
+        with self.assertRaises(NoMatchingChunksError):
+            self.search(source="c.pdf", batch_id="batch-1")
+        with self.assertRaises(NoMatchingChunksError):
+            self.search(page_from=6)
+
+    def test_unknown_session_with_filters_raises_session_error(self):
+        with self.assertRaises(SessionIndexNotFoundError):
+            self.store.similarity_search("missing", "page", filters=SearchFilter(source="a.pdf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+"""Tests for the RetrievalService ingestion bookkeeping."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.backend.services.vector_service import vector_service
+
+
+class TestUpsertFiles(unittest.TestCase):
+    def setUp(self):
+        self.store = MagicMock()
+        with patch.object(vector_service, "GoogleGenerativeAIEmbeddings"), patch.object(
+            vector_service.VectorStoreBuilder, "build_vector_store", return_value=self.store
+        ):
+            self.service = vector_service.RetrievalService()
+
+    def upload(self):
+        files = [("a.txt", b"alpha " * 400), ("b.txt", b"beta " * 400)]
+        return self.service.upsert_files("session", files)
+
+    def test_every_chunk_gets_the_returned_batch_id(self):
+        result = self.upload()
+
+        session_id, texts, metas = self.store.add_texts.call_args.args
+        self.assertEqual(session_id, "session")
+        self.assertGreater(len(metas), 2)
+        self.assertEqual(len(texts), len(metas))
+        self.assertEqual({meta["batch_id"] for meta in metas}, {result["batch_id"]})
+        self.assertEqual(result["chunks_count"], len(metas))
+
+    def test_each_upload_gets_a_new_batch_id(self):
+        self.assertNotEqual(self.upload()["batch_id"], self.upload()["batch_id"])
+
+
+if __name__ == "__main__":
+    unittest.main()